@@ -3,8 +3,20 @@ Goal-to-Task Conversion Agent - Streamlit App
 Web application that converts user goals into actionable HTML task breakdowns
 """
 
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+import threading
+
+import diskcache
+import httpx
+import numpy as np
 import streamlit as st
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from openai import APIConnectionError, AsyncOpenAI, OpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from datetime import datetime
 
 # Page configuration
@@ -58,6 +70,7 @@ SYSTEM_PROMPT = """**ROLE:** You are a Goal-to-Task Conversion Assistant special
 - Color coordination across phases
 - Mobile-responsive design
 - Clean, modern aesthetic
+- Add "content-visibility: auto; contain-intrinsic-size: 0 400px;" to the phase card CSS rule so the browser skips layout and paint for off-screen cards
 
 **CAPABILITIES & REMINDERS:** You can break down complex goals into manageable phases (typically 3-5 phases), suggest realistic timelines, prioritize tasks by importance and dependencies. Always structure tasks logically from initial planning through execution and completion. Make the HTML visually appealing and professional."""
 
@@ -72,119 +85,371 @@ def get_api_key():
         return None
 
 
-def convert_goal_to_tasks(api_key: str, user_goal: str) -> str:
-    """Convert a user goal into an HTML task breakdown"""
-    try:
-        client = OpenAI(api_key=api_key)
-        
-        with st.spinner("🤖 AI is breaking down your goal into actionable tasks..."):
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_goal}
-                ],
-                temperature=0.7,
-                max_tokens=4000
+# Default generation parameters; the fast model handles the HTML-skeleton
+# task well and falls back to the strong one when validation fails
+MODEL_FAST = "gpt-4o-mini"
+MODEL_STRONG = "gpt-4o"
+TEMPERATURE = 0.7
+MAX_TOKENS = 4000
+
+# Candidates generated per request; extras are nearly free latency-wise
+# because they're sampled in the same batched forward pass
+N_CANDIDATES = 3
+
+# Routes requests to the same server-side prefix cache so the static
+# SYSTEM_PROMPT tokens are only processed on the first call
+PROMPT_CACHE_KEY = "goal-to-task-v1"
+
+# Example goals offered in the sidebar and pre-generated at warm-up
+EXAMPLE_GOALS = [
+    "Learn Spanish in 6 months",
+    "Start a YouTube channel",
+    "Build a mobile app",
+    "Write a novel",
+    "Get fit and run a marathon",
+    "Launch an online business"
+]
+
+# Persistent cache for generated breakdowns, survives app restarts
+_llm_cache = diskcache.Cache("./.llm_cache")
+
+# Semantic cache settings: near-duplicate goals reuse a cached breakdown
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_SIMILARITY_THRESHOLD = 0.93
+_SEMANTIC_INDEX_KEY = "_semantic_index"
+
+
+def _request_cache_key(user_goal: str, model: str, temperature: float,
+                       max_tokens: int, n: int = 1) -> str:
+    """Build a stable hash of everything that influences the LLM response"""
+    canonical = json.dumps(
+        [SYSTEM_PROMPT, user_goal, model, temperature, max_tokens, n],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Connection pool shared by all OpenAI clients
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+# Memoized by hand rather than st.cache_resource: the client is also used
+# from executor threads, which have no Streamlit script context
+_sync_clients = {}
+_sync_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    """One pooled client reused across reruns instead of per-request TLS setup"""
+    with _sync_clients_lock:
+        client = _sync_clients.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS)
             )
-            
-            html_output = response.choices[0].message.content
-            
-            # Clean up any markdown code blocks if present
-            # Using chr(96) for backtick to avoid syntax issues
-            tick = chr(96)
-            html_marker = tick + tick + tick + "html"
-            code_marker = tick + tick + tick
-            
-            if html_output.startswith(html_marker):
-                html_output = html_output.replace(html_marker, "").replace(code_marker, "").strip()
-            elif html_output.startswith(code_marker):
-                html_output = html_output.replace(code_marker, "").strip()
-            
-            return html_output
-            
-    except Exception as e:
-        st.error(f"❌ Error: {str(e)}")
+            _sync_clients[api_key] = client
+        return client
+
+
+# Retry transient OpenAI failures (rate limits, dropped connections) with
+# jittered exponential backoff; auth and request errors still fail fast
+_llm_retry = retry(
+    wait=wait_random_exponential(min=1, max=20),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    reraise=True
+)
+
+
+# How often the script polls a running generation for progress; also
+# debounces live preview refreshes so the iframe isn't re-laying-out
+# on every streamed chunk
+_POLL_INTERVAL_SECONDS = 0.5
+
+
+class _GenerationJob:
+    """Progress shared between a generation worker and the script thread
+
+    The worker must not touch Streamlit APIs (it has no script context),
+    so it reports through this object and the polling fragment renders it.
+    """
+
+    def __init__(self):
+        self.partial = ""
+        self.semantic_hit = None
+        self.cached_tokens = None
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Shared pool for running generations off the script thread"""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@_llm_retry
+async def _stream_completion(api_key: str, user_goal: str, model: str,
+                             temperature: float, max_tokens: int, n: int,
+                             job: _GenerationJob) -> list:
+    """Stream a chat completion, publishing the first candidate as it arrives"""
+    # The async client binds to the event loop asyncio.run creates for this
+    # call, so unlike the sync client it can't be shared across reruns; the
+    # context manager closes its sockets before the loop is torn down
+    async with AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+    ) as client:
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_goal}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            n=n,
+            prompt_cache_key=PROMPT_CACHE_KEY,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        # With n > 1 the stream interleaves chunks from all candidates,
+        # tagged by choice index; only candidate 0 is published live
+        buffers = {}
+        usage = None
+        async for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            for choice in chunk.choices:
+                delta = choice.delta.content
+                if delta:
+                    buffers[choice.index] = buffers.get(choice.index, "") + delta
+                    if choice.index == 0:
+                        job.partial = buffers[0]
+
+    # Surface how many prompt tokens hit the server-side cache for diagnostics
+    details = getattr(usage, "prompt_tokens_details", None)
+    if details is not None:
+        job.cached_tokens = details.cached_tokens
+
+    return [buffers[index] for index in sorted(buffers)]
+
+
+def _generate_html(api_key: str, user_goal: str, model: str, temperature: float,
+                   max_tokens: int, job: _GenerationJob, n: int = N_CANDIDATES) -> list:
+    """Call the LLM for a goal, consulting the persistent cache first"""
+    cache_key = _request_cache_key(user_goal, model, temperature, max_tokens, n)
+
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    candidates = asyncio.run(
+        _stream_completion(api_key, user_goal, model, temperature, max_tokens, n, job)
+    )
+
+    candidates = [_clean_html_output(candidate) for candidate in candidates]
+
+    # Store the cleaned HTML so future hits skip the cleanup too
+    _llm_cache.set(cache_key, candidates)
+
+    return candidates
+
+
+# Opening ```html / ``` fence at the very start, or closing fence at the end
+_FENCE_RE = re.compile(r"^```(?:html)?\n?|\n?```$")
+
+
+def _clean_html_output(html_output: str) -> str:
+    """Strip any markdown code fences the model wrapped around the HTML"""
+    # Anchored, so backticks inside the document body are left alone
+    return _FENCE_RE.sub("", html_output).strip()
+
+
+@_llm_retry
+async def _prewarm_goal(client: AsyncOpenAI, goal: str) -> None:
+    """Generate and cache one example goal unless it's already cached"""
+    # Same key (including n) as the interactive path, so clicks hit the cache
+    cache_key = _request_cache_key(goal, MODEL_FAST, TEMPERATURE, MAX_TOKENS, N_CANDIDATES)
+    if _llm_cache.get(cache_key) is not None:
+        return
+
+    response = await client.chat.completions.create(
+        model=MODEL_FAST,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": goal}
+        ],
+        temperature=TEMPERATURE,
+        max_tokens=MAX_TOKENS,
+        n=N_CANDIDATES,
+        prompt_cache_key=PROMPT_CACHE_KEY
+    )
+
+    _llm_cache.set(
+        cache_key,
+        [_clean_html_output(choice.message.content) for choice in response.choices]
+    )
+
+
+async def _prewarm(api_key: str, goals: list) -> None:
+    """Generate all uncached example goals concurrently"""
+    async with AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+    ) as client:
+        await asyncio.gather(*[_prewarm_goal(client, goal) for goal in goals])
+
+
+@st.cache_resource
+def prewarm_example_goals(api_key: str) -> threading.Thread:
+    """Pre-generate the example goals once per process, off the render path"""
+    thread = threading.Thread(
+        target=lambda: asyncio.run(_prewarm(api_key, EXAMPLE_GOALS)),
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+
+@_llm_retry
+def _embed_goal(api_key: str, user_goal: str) -> np.ndarray:
+    """Embed a goal into a unit vector for similarity search"""
+    client = get_openai_client(api_key)
+    response = client.embeddings.create(model=EMBEDDING_MODEL, input=user_goal)
+    vector = np.array(response.data[0].embedding, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _semantic_lookup(vector: np.ndarray, model: str) -> list:
+    """Return the cached candidates of the most similar past goal, or None
+
+    Only entries generated for the requested model are considered, so
+    switching the sidebar model actually changes what a repeat goal gets.
+    """
+    entries = _llm_cache.get(_SEMANTIC_INDEX_KEY)
+    if not entries:
         return None
 
+    # Untagged entries predate per-model storage and are skipped
+    entries = [entry for entry in entries if len(entry) == 3 and entry[2] == model]
+    if not entries:
+        return None
 
-def main():
-    """Main Streamlit application"""
-    
-    # Custom CSS
-    st.markdown("""
-        <style>
-        .main-header {
-            text-align: center;
-            padding: 2rem 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 10px;
-            margin-bottom: 2rem;
-        }
-        .stButton>button {
-            width: 100%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 0.75rem;
-            font-size: 1.1rem;
-            font-weight: bold;
-            border-radius: 8px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Header
-    st.markdown("""
-        <div class="main-header">
-            <h1>🎯 Goal-to-Task Converter</h1>
-            <p>Transform any goal into actionable, achievable tasks</p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    # Sidebar
-    with st.sidebar:
-        st.header("⚙️ Settings")
-        
-        # About section
-        st.header("ℹ️ About")
-        st.markdown("""
-        This app uses OpenAI's GPT-4 to break down your goals into:
-        - 3-5 manageable phases
-        - Specific actionable tasks
-        - Realistic timelines
-        - Beautiful HTML output
-        
-        🔒 API key is securely managed via Streamlit secrets.
-        """)
-        
-        st.markdown("---")
-        
-        # Example goals
-        st.header("💡 Example Goals")
-        example_goals = [
-            "Learn Spanish in 6 months",
-            "Start a YouTube channel",
-            "Build a mobile app",
-            "Write a novel",
-            "Get fit and run a marathon",
-            "Launch an online business"
-        ]
-        
-        for goal in example_goals:
-            if st.button(goal, key=f"example_{goal}"):
-                st.session_state.selected_goal = goal
-    
-    # Main content area
+    # Vectors are unit-normalized, so cosine similarity is a dot product
+    matrix = np.stack([entry[0] for entry in entries])
+    scores = matrix @ vector
+    best = int(np.argmax(scores))
+
+    if scores[best] >= SEMANTIC_SIMILARITY_THRESHOLD:
+        return entries[best][1]
+    return None
+
+
+def _semantic_store(vector: np.ndarray, candidates: list, model: str) -> None:
+    """Add a (vector, candidates, model) entry to the persistent semantic index"""
+    entries = _llm_cache.get(_SEMANTIC_INDEX_KEY) or []
+    entries.append((vector, candidates, model))
+    _llm_cache.set(_SEMANTIC_INDEX_KEY, entries)
+
+
+# Generated breakdowns always mention their 3-5 phases somewhere in the markup
+_PHASE_RE = re.compile(r"phase", re.IGNORECASE)
+
+
+def _is_valid_breakdown(html_output: str) -> bool:
+    """Cheap structural check that the output looks like a full breakdown"""
+    return (
+        html_output.lstrip().lower().startswith("<!doctype html")
+        and len(_PHASE_RE.findall(html_output)) >= 3
+    )
+
+
+def _record_semantic_event(hit: bool) -> None:
+    """Track semantic cache hits/misses in session state for diagnostics"""
+    stats = st.session_state.setdefault("semantic_cache_stats", {"hits": 0, "misses": 0})
+    stats["hits" if hit else "misses"] += 1
+
+
+def convert_goal_to_tasks(api_key: str, user_goal: str, use_semantic_cache: bool,
+                          model: str, job: _GenerationJob) -> list:
+    """Convert a user goal into HTML task breakdown candidates
+
+    Runs on the executor, so it must not touch Streamlit APIs; progress
+    and diagnostics go through the job, errors propagate via the future.
+    """
+    vector = None
+    if use_semantic_cache:
+        vector = _embed_goal(api_key, user_goal)
+        cached = _semantic_lookup(vector, model)
+        if cached is not None:
+            job.semantic_hit = True
+            return cached
+        job.semantic_hit = False
+
+    candidates = _generate_html(api_key, user_goal, model, TEMPERATURE, MAX_TOKENS, job)
+
+    # If the fast model produced nothing usable, retry once with
+    # the strong model rather than showing a broken breakdown
+    if model == MODEL_FAST and not any(_is_valid_breakdown(c) for c in candidates):
+        candidates = _generate_html(api_key, user_goal, MODEL_STRONG, TEMPERATURE, MAX_TOKENS, job)
+        # Overwrite the fast-model entry with the good output so future
+        # requests for this goal don't keep re-reading a known-bad entry
+        # and re-failing validation
+        _llm_cache.set(
+            _request_cache_key(user_goal, MODEL_FAST, TEMPERATURE, MAX_TOKENS, N_CANDIDATES),
+            candidates
+        )
+
+    # Stored under the requested model: with the fallback above, this is
+    # what a repeat of the goal at this setting should get back
+    if vector is not None:
+        _semantic_store(vector, candidates, model)
+
+    return candidates
+
+
+@st.fragment(run_every=_POLL_INTERVAL_SECONDS)
+def generation_progress():
+    """Show streamed progress for the pending generation
+
+    run_every makes this fragment re-execute itself on a timer, so no
+    explicit fragment-scoped rerun is ever issued - Streamlit forbids
+    those during full-script runs, and widgets outside the workspace
+    (sidebar buttons, settings) trigger full runs while a generation
+    is pending.
+    """
+    future = st.session_state.get("generation_future")
+    if future is None:
+        return
+
+    if future.done():
+        # Full rerun so the workspace collects and renders the result
+        st.rerun()
+
+    job = st.session_state.generation_job
+    with st.status("🤖 AI is breaking down your goal into actionable tasks...", expanded=True):
+        if job.partial:
+            # Browsers tolerate truncated HTML, so the iframe
+            # progressively reveals phase cards as they stream in
+            st.components.v1.html(
+                _clean_html_output(job.partial) + "</body></html>",
+                height=800,
+                scrolling=True
+            )
+
+
+@st.fragment
+def goal_workspace(use_semantic_cache: bool, model: str):
+    """Goal input and results section; reruns alone on generate clicks"""
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         st.subheader("📝 Enter Your Goal")
-        
+
         # Use selected goal from sidebar if available
         default_goal = st.session_state.get("selected_goal", "")
-        
+
         user_goal = st.text_area(
             "What do you want to achieve?",
             value=default_goal,
@@ -192,75 +457,207 @@ def main():
             placeholder="E.g., Learn web development and build my first website",
             help="Enter any personal, professional, creative, or educational goal"
         )
-        
+
         # Generate button
         generate_clicked = st.button("🚀 Generate Task Breakdown", type="primary")
-    
+
     with col2:
         st.subheader("💭 Tips")
         st.markdown("""
         **Be specific:**
         - ✅ "Learn Python for data analysis"
         - ❌ "Learn programming"
-        
+
         **Include timeframe:**
         - ✅ "Get fit in 3 months"
         - ❌ "Get fit"
-        
+
         **Be realistic:**
         - ✅ "Build a portfolio website"
         - ❌ "Build the next Facebook"
         """)
-    
-    # Process the goal
+
+    # Kick off generation in the background so the script thread stays free
     if generate_clicked:
         api_key = get_api_key()
-        
+
         if not api_key:
             st.error("⚠️ API key configuration error. Please contact the app administrator.")
         elif not user_goal.strip():
             st.warning("⚠️ Please enter a goal!")
         else:
-            # Convert goal to tasks
-            html_output = convert_goal_to_tasks(api_key, user_goal.strip())
-            
-            if html_output:
-                st.success("✅ Task breakdown generated successfully!")
-                
-                # Store in session state
-                st.session_state.html_output = html_output
-                st.session_state.goal_name = user_goal.strip()
-    
+            job = _GenerationJob()
+            st.session_state.generation_job = job
+            st.session_state.generation_goal = user_goal.strip()
+            st.session_state.generation_future = get_executor().submit(
+                convert_goal_to_tasks, api_key, user_goal.strip(),
+                use_semantic_cache, model, job
+            )
+
+    # A pending generation is watched by the self-rerunning progress
+    # fragment; once it's done, collect the result and clear the job
+    future = st.session_state.get("generation_future")
+    if future is not None and not future.done():
+        generation_progress()
+    elif future is not None:
+        job = st.session_state.generation_job
+        del st.session_state.generation_future
+        del st.session_state.generation_job
+        try:
+            candidates = future.result()
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+            candidates = None
+
+        if candidates:
+            st.success("✅ Task breakdown generated successfully!")
+
+            # Record diagnostics the worker couldn't write itself
+            if job.semantic_hit is not None:
+                _record_semantic_event(job.semantic_hit)
+            if job.cached_tokens is not None:
+                st.session_state.prompt_cached_tokens = job.cached_tokens
+
+            # Store gzipped in session state: ~5-10x smaller payload to
+            # re-serialize on every rerun, lower memory per session
+            st.session_state.html_candidates_gz = [
+                gzip.compress(candidate.encode("utf-8"), compresslevel=6)
+                for candidate in candidates
+            ]
+            st.session_state.goal_name = st.session_state.pop("generation_goal")
+            # Fix the filename at generation time so reruns don't hit
+            # datetime/strftime and the name stays stable per breakdown
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            st.session_state.download_filename = f"goal_breakdown_{timestamp}.html"
+
     # Display results if available
-    if "html_output" in st.session_state:
+    if "html_candidates_gz" in st.session_state:
         st.markdown("---")
         st.subheader("📊 Your Task Breakdown")
-        
+
+        # Let the user flip through the candidates; the extras were sampled
+        # in the same request, so switching costs no LLM call
+        candidates_gz = st.session_state.html_candidates_gz
+        if len(candidates_gz) > 1:
+            variant = st.radio(
+                "Variant",
+                range(1, len(candidates_gz) + 1),
+                horizontal=True
+            )
+        else:
+            variant = 1
+        # Only the selected variant is ever decompressed
+        html_output = gzip.decompress(candidates_gz[variant - 1]).decode("utf-8")
+
         # Create tabs for preview and download
         tab1, tab2 = st.tabs(["🖼️ Preview", "💾 Download"])
-        
+
         with tab1:
             # Display HTML in iframe
-            st.components.v1.html(st.session_state.html_output, height=800, scrolling=True)
-        
+            st.components.v1.html(html_output, height=800, scrolling=True)
+
         with tab2:
             st.markdown("### Download Your Task Breakdown")
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"goal_breakdown_{timestamp}.html"
-            
-            # Download button
-            st.download_button(
-                label="📥 Download HTML File",
-                data=st.session_state.html_output,
-                file_name=filename,
-                mime="text/html",
-                help="Download the HTML file to open in your browser"
-            )
-            
+
+            # Both tabs render on every rerun, and a download button ships
+            # its whole payload to the browser when built - so don't build
+            # it until the user asks for the file
+            if st.checkbox("Prepare download file", key="prepare_download"):
+                st.download_button(
+                    label="📥 Download HTML File",
+                    data=html_output,
+                    file_name=st.session_state.download_filename,
+                    mime="text/html",
+                    help="Download the HTML file to open in your browser"
+                )
+
             st.info("💡 **Tip:** Open the downloaded HTML file in any web browser to view your beautiful task breakdown!")
+
+
+# Custom CSS and page header, built once at import instead of per rerun
+_STATIC_HEAD = """
+    <style>
+    .main-header {
+        text-align: center;
+        padding: 2rem 0;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+    }
+    .stButton>button {
+        width: 100%;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 0.75rem;
+        font-size: 1.1rem;
+        font-weight: bold;
+        border-radius: 8px;
+    }
+    </style>
+    <div class="main-header">
+        <h1>🎯 Goal-to-Task Converter</h1>
+        <p>Transform any goal into actionable, achievable tasks</p>
+    </div>
+"""
+
+
+def main():
+    """Main Streamlit application"""
+
+    # Warm the cache for the example goals without blocking first render;
+    # a missing key is reported when the user actually generates
+    try:
+        prewarm_example_goals(st.secrets["OPENAI_API_KEY"])
+    except (KeyError, FileNotFoundError):
+        pass
+
+    # CSS and header in one element; fragment reruns skip this entirely
+    st.markdown(_STATIC_HEAD, unsafe_allow_html=True)
+
+
+    # Sidebar
+    with st.sidebar:
+        st.header("⚙️ Settings")
+
+        use_semantic_cache = st.checkbox(
+            "🧠 Semantic cache",
+            value=True,
+            help="Reuse breakdowns from previously submitted goals with the same meaning"
+        )
+
+        model_choice = st.radio(
+            "⚡ Model",
+            ["Fast (gpt-4o-mini)", "Strong (gpt-4o)"],
+            help="Fast is ~10x cheaper and noticeably quicker; it falls back to Strong automatically if its output fails validation"
+        )
+        model = MODEL_FAST if model_choice.startswith("Fast") else MODEL_STRONG
+
+        # About section
+        st.header("ℹ️ About")
+        st.markdown("""
+        This app uses OpenAI's GPT-4 to break down your goals into:
+        - 3-5 manageable phases
+        - Specific actionable tasks
+        - Realistic timelines
+        - Beautiful HTML output
+        
+        🔒 API key is securely managed via Streamlit secrets.
+        """)
+        
+        st.markdown("---")
+        
+        # Example goals
+        st.header("💡 Example Goals")
+        for goal in EXAMPLE_GOALS:
+            if st.button(goal, key=f"example_{goal}"):
+                st.session_state.selected_goal = goal
     
+    # Main content area: isolated fragment so generating a breakdown only
+    # reruns this section, not the CSS/header/sidebar/footer above and below
+    goal_workspace(use_semantic_cache, model)
+
     # Footer
     st.markdown("---")
     st.markdown("""